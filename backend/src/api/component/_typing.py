@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import types
+from functools import lru_cache
+from typing import Annotated, Any, Union, get_args, get_origin
+
+
+@lru_cache(maxsize=1024)
+def type_str(t: Any) -> str:
+    """Readable name for a type annotation, e.g. ``list[int]`` or ``str | None``."""
+    if t is None or t is types.NoneType:
+        return "None"
+    origin = get_origin(t)
+    if origin is None:
+        return getattr(t, "__name__", str(t))
+    args = get_args(t)
+    if origin is Annotated:
+        return type_str(args[0])
+    if origin is Union or origin is types.UnionType:
+        return " | ".join(type_str(a) for a in args)
+    name = getattr(origin, "__name__", str(origin))
+    if not args:
+        return name
+    return f"{name}[{_join(args)}]"
+
+
+def _join(args: tuple[Any, ...] | list[Any]) -> str:
+    # Callable parameter lists arrive as plain (unhashable) lists, so expand them here.
+    return ", ".join(f"[{_join(a)}]" if isinstance(a, list) else type_str(a) for a in args)
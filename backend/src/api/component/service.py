@@ -1,9 +1,53 @@
 from __future__ import annotations
 
+import hashlib
+from functools import cache
 from typing import Any
 
+import orjson
+
+from src.api.component._typing import type_str
 from src.core.component import Component
 
+_payload: bytes | None = None
+_payload_etag = ""
+_payload_version = -1
+
+
+@cache
+def _describe(name: str, cls: type[Component[..., Any]]) -> dict[str, Any]:
+    """Type introspection for one component class; classes are immutable once defined."""
+    init = cls.get_init_types()
+    inputs = cls.get_input_types()
+    outputs = cls.get_output_types()
+
+    if not inputs:
+        category = "source"
+    elif not outputs:
+        category = "sink"
+    else:
+        category = "conduit"
+
+    return {
+        "name": name,
+        "category": category,
+        "init": {k: type_str(v) for k, v in init.items()},
+        "inputs": {k: type_str(v) for k, v in inputs.items()},
+        "outputs": {k: type_str(v) for k, v in outputs.items()},
+    }
+
+
+def list_components() -> tuple[tuple[str, type[Component[..., Any]]], ...]:
+    return Component.registry_snapshot()
+
 
-def list_components() -> dict[str, type[Component[..., Any]]]:
-    return Component.registered_subclasses()
+def list_components_payload() -> tuple[bytes, str]:
+    """JSON body for GET /component and its ETag, rebuilt only when a new Component subclass is registered."""
+    global _payload, _payload_etag, _payload_version
+    if _payload is None or _payload_version != Component.registry_version():
+        # Listing may import component modules and bump the version, so read it afterwards.
+        classes = list_components()
+        _payload = orjson.dumps([_describe(name, cls) for name, cls in classes])
+        _payload_etag = f'"{hashlib.blake2b(_payload, digest_size=8).hexdigest()}"'
+        _payload_version = Component.registry_version()
+    return _payload, _payload_etag
@@ -5,5 +5,5 @@ from fastapi import Request
 from src.api.graph.domain.graph import Graph
 
 
-def get_graph(request: Request) -> Graph:
+async def get_graph(request: Request) -> Graph:
     return request.app.state.graph
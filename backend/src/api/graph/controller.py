@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from src.api.graph.domain.graph import Graph, Node
 from src.api.dep import get_graph
@@ -11,15 +12,18 @@ router = APIRouter(prefix="/graph")
 
 
 def _node_response(node_id: str, node: Node) -> NodeResponse:
-    return NodeResponse(id=node_id, type=type(node.inner).__name__, status=node.inner.status.value)
+    return NodeResponse.model_construct(id=node_id, type=node.type_name, status=node.inner.status_value)
 
 
-@router.get("/nodes")
-def list_nodes(graph: Graph = Depends(get_graph)) -> list[NodeResponse]:
-    return [_node_response(nid, node) for nid, node in service.list_nodes(graph).items()]
+@router.get("/nodes", response_model=list[NodeResponse], response_class=ORJSONResponse)
+async def list_nodes(graph: Graph = Depends(get_graph)) -> ORJSONResponse:
+    return ORJSONResponse([
+        {"id": nid, "type": node.type_name, "status": node.inner.status_value}
+        for nid, node in service.list_nodes(graph).items()
+    ])
 
 
-@router.get("/nodes/{node_id}")
+@router.get("/nodes/{node_id}", response_class=ORJSONResponse)
 def get_node(node_id: str, graph: Graph = Depends(get_graph)) -> NodeResponse:
     node = service.get_node(graph, node_id)
     if node is None:
@@ -27,7 +31,7 @@ def get_node(node_id: str, graph: Graph = Depends(get_graph)) -> NodeResponse:
     return _node_response(node_id, node)
 
 
-@router.post("/nodes", status_code=201)
+@router.post("/nodes", status_code=201, response_class=ORJSONResponse)
 def create_node(req: NodeCreateRequest, graph: Graph = Depends(get_graph)) -> NodeResponse:
     try:
         node_id, node = service.create_node(graph, req.type)
@@ -51,20 +55,13 @@ def stop_all(graph: Graph = Depends(get_graph)) -> None:
     service.stop_all(graph)
 
 
-@router.get("/edges")
-def list_edges(graph: Graph = Depends(get_graph)) -> list[EdgeResponse]:
-    return [
-        EdgeResponse(
-            source_node=e.source_node,
-            source_slot=e.source_slot,
-            target_node=e.target_node,
-            target_slot=e.target_slot,
-        )
-        for e in service.list_edges(graph)
-    ]
+@router.get("/edges", response_model=list[EdgeResponse], response_class=ORJSONResponse)
+async def list_edges(graph: Graph = Depends(get_graph)) -> ORJSONResponse:
+    # Edge has the same fields as EdgeResponse; orjson serializes the dataclasses natively.
+    return ORJSONResponse(service.list_edges(graph))
 
 
-@router.post("/edges", status_code=201)
+@router.post("/edges", status_code=201, response_class=ORJSONResponse)
 def create_edge(req: EdgeCreateRequest, graph: Graph = Depends(get_graph)) -> EdgeResponse:
     try:
         service.create_edge(graph, req.source_node, req.source_slot, req.target_node, req.target_slot)
@@ -72,7 +69,7 @@ def create_edge(req: EdgeCreateRequest, graph: Graph = Depends(get_graph)) -> Ed
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    return EdgeResponse(
+    return EdgeResponse.model_construct(
         source_node=req.source_node,
         source_slot=req.source_slot,
         target_node=req.target_node,
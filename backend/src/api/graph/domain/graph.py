@@ -1,25 +1,33 @@
 from __future__ import annotations
 
+import json
+import os
+from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from src.core.component import Component
 
 
-import json
 from pathlib import Path
 
 
-class Node(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
+# Node and Edge are plain slotted dataclasses: they are internal storage only, and the API
+# boundary validates through the DTOs instead.
+@dataclass(slots=True)
+class Node:
     inner: Component[..., Any]
     x: float = 0.0
     y: float = 0.0
+    type_name: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.type_name = type(self.inner).__name__
 
 
-class Edge(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Edge:
     source_node: str
     source_slot: str
     target_node: str
@@ -32,11 +40,71 @@ class Graph(BaseModel):
     edges: list[Edge]
     nodes: dict[str, Node]
 
+    # Adjacency indices over self.edges, keyed by node id.
+    _by_source: dict[str, list[Edge]] = PrivateAttr(default_factory=dict)
+    _by_target: dict[str, list[Edge]] = PrivateAttr(default_factory=dict)
+    _edge_set: set[Edge] = PrivateAttr(default_factory=set)
+    _next_id: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any) -> None:
+        for edge in self.edges:
+            self._edge_set.add(edge)
+            self._by_source.setdefault(edge.source_node, []).append(edge)
+            self._by_target.setdefault(edge.target_node, []).append(edge)
+
+    def new_node_id(self) -> str:
+        """Short sequential id, skipping any already taken by loaded nodes."""
+        while (node_id := str(self._next_id)) in self.nodes:
+            self._next_id += 1
+        self._next_id += 1
+        return node_id
+
+    def inputs_of(self, node_id: str) -> list[Edge]:
+        """Edges feeding node_id, straight from the target index."""
+        return self._by_target.get(node_id, [])
+
+    def has_edge(self, edge: Edge) -> bool:
+        return edge in self._edge_set
+
+    def add_edge(self, edge: Edge) -> None:
+        self._edge_set.add(edge)
+        self.edges.append(edge)
+        self._by_source.setdefault(edge.source_node, []).append(edge)
+        self._by_target.setdefault(edge.target_node, []).append(edge)
+
+    def remove_edge(self, edge: Edge) -> None:
+        """Raises ValueError if the edge is not in the graph."""
+        if edge not in self._edge_set:
+            raise ValueError(f"Edge not found: {edge}")
+        self._edge_set.discard(edge)
+        self.edges.remove(edge)
+        self._by_source[edge.source_node].remove(edge)
+        self._by_target[edge.target_node].remove(edge)
+
+    def remove_node_edges(self, node_id: str) -> list[Edge]:
+        """Detaches every edge touching node_id and returns them."""
+        outgoing = self._by_source.pop(node_id, [])
+        # Self-loops are already in outgoing.
+        incoming = [e for e in self._by_target.pop(node_id, []) if e.source_node != node_id]
+        for edge in outgoing:
+            if (peers := self._by_target.get(edge.target_node)) is not None:
+                peers.remove(edge)
+        for edge in incoming:
+            if (peers := self._by_source.get(edge.source_node)) is not None:
+                peers.remove(edge)
+        self._edge_set.difference_update(outgoing)
+        self._edge_set.difference_update(incoming)
+        if outgoing or incoming:
+            self.edges = [e for e in self.edges if e.source_node != node_id and e.target_node != node_id]
+        return outgoing + incoming
+
     def save_to_file(self, path: str | Path = "saves/graph.json"):
         """Saves current graph state to a JSON file."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Auto-saves run on a timer thread, so iterate a copy in case a request adds a node meanwhile.
+        nodes = dict(self.nodes)
         data = {
             "nodes": {
                 node_id: {
@@ -45,7 +113,7 @@ class Graph(BaseModel):
                     "y": node.y,
                     "config": node.inner.config.to_dict(),
                 }
-                for node_id, node in self.nodes.items()
+                for node_id, node in nodes.items()
             },
             "edges": [
                 {
@@ -58,5 +126,8 @@ class Graph(BaseModel):
             ],
         }
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=4)
+        # Write then rename, so a crash mid-write never leaves a truncated save.
+        # json rather than orjson: orjson only indents by 2, and the save format stays at 4.
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=4))
+        os.replace(tmp, path)
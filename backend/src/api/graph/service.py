@@ -1,15 +1,45 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import cache
 from typing import Any
 
 from src.api.graph.domain.graph import Graph, Node, Edge
 from src.core.channel import Channel
 from src.core.component import Component
 from pathlib import Path
-import json
+import orjson
 
 
 import inspect
+import threading
+import time
+
+
+@cache
+def _config_cls_for(cls: type[Component[..., Any]]) -> Any:
+    """Resolves the config class from cls.__init__'s annotation, or None. Classes are immutable once defined."""
+    # Inspect __init__ to find config class
+    sig = inspect.signature(cls.__init__)
+    config_param = sig.parameters.get("config")
+    if config_param is None or config_param.annotation is inspect.Parameter.empty:
+        return None
+    config_cls = config_param.annotation
+    # Handle string type hints
+    if isinstance(config_cls, str):
+        # Handle Union types like "DiscordConfig | None"
+        if "|" in config_cls:
+            # Take the first part before the | (the actual config class)
+            config_cls_name = config_cls.split("|")[0].strip()
+        else:
+            config_cls_name = config_cls
+
+        # Get the module where the class is defined
+        module = inspect.getmodule(cls)
+        if module:
+            config_cls = getattr(module, config_cls_name)
+
+    return config_cls if hasattr(config_cls, "from_dict") else None
 
 
 def load_graph(path: str | Path = "saves/graph.json") -> Graph:
@@ -18,10 +48,9 @@ def load_graph(path: str | Path = "saves/graph.json") -> Graph:
     if not path.exists():
         return Graph(nodes={}, edges=[])
 
-    with open(path, "r") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
-    classes = Component.registered_subclasses()
+    classes = Component.registry()
     nodes: dict[str, Node] = {}
     for node_id, node_data in data.get("nodes", {}).items():
         node_type = node_data["type"]
@@ -30,28 +59,8 @@ def load_graph(path: str | Path = "saves/graph.json") -> Graph:
             print(f"Warning: Unknown node type {node_type}")
             continue
 
-        # Inspect __init__ to find config class
-        sig = inspect.signature(cls.__init__)
-        config_param = sig.parameters.get("config")
-        config = None
-        if config_param and config_param.annotation is not inspect.Parameter.empty:
-            config_cls = config_param.annotation
-            # Handle string type hints
-            if isinstance(config_cls, str):
-                # Handle Union types like "DiscordConfig | None"
-                if "|" in config_cls:
-                    # Take the first part before the | (the actual config class)
-                    config_cls_name = config_cls.split("|")[0].strip()
-                else:
-                    config_cls_name = config_cls
-                
-                # Get the module where the class is defined
-                module = inspect.getmodule(cls)
-                if module:
-                    config_cls = getattr(module, config_cls_name)
-            
-            if hasattr(config_cls, "from_dict"):
-                config = config_cls.from_dict(node_data["config"])
+        config_cls = _config_cls_for(cls)
+        config = config_cls.from_dict(node_data["config"]) if config_cls is not None else None
 
         comp = cls(config=config)
         comp.name = node_type
@@ -61,8 +70,66 @@ def load_graph(path: str | Path = "saves/graph.json") -> Graph:
     return Graph(nodes=nodes, edges=edges)
 
 
+class _SaveScheduler:
+    """Coalesces auto-saves: each schedule() pushes the deadline back, and only the last one writes.
+
+    One daemon worker, started on first use, waits for the deadline, so bursts of mutations
+    don't start a thread each.
+    """
+
+    def __init__(self, delay: float = 0.25) -> None:
+        self._delay = delay
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._graph: Graph | None = None
+        self._deadline = 0.0
+        self._worker: threading.Thread | None = None
+
+    def schedule(self, graph: Graph) -> None:
+        with self._cond:
+            self._graph = graph
+            self._deadline = time.monotonic() + self._delay
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="graph-autosave", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._graph is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            try:
+                self.flush()
+            except Exception as e:
+                # Keep the worker alive; the next mutation schedules another attempt.
+                print(f"[graph] Auto-save failed: {e!r}")
+
+    def flush(self) -> None:
+        """Writes a pending save now, if any. Safe to call from any thread."""
+        with self._write_lock:
+            with self._cond:
+                graph, self._graph = self._graph, None
+            if graph is not None:
+                graph.save_to_file()
+
+
+_saver = _SaveScheduler()
+
+
 def _auto_save(graph: Graph) -> None:
-    graph.save_to_file()
+    _saver.schedule(graph)
+
+
+def flush_auto_save() -> None:
+    """Writes any debounced auto-save immediately; call on shutdown."""
+    _saver.flush()
 
 
 def list_nodes(graph: Graph) -> dict[str, Node]:
@@ -74,13 +141,13 @@ def get_node(graph: Graph, node_id: str) -> Node | None:
 
 
 def create_node(graph: Graph, node_type: str) -> tuple[str, Node]:
-    classes = Component.registered_subclasses()
+    classes = Component.registry()
     cls = classes.get(node_type)
     if cls is None:
         raise ValueError(f"Unknown node type: {node_type}")
 
     comp = cls()
-    node_id = str(id(comp))
+    node_id = graph.new_node_id()
     comp.name = node_type
     node = Node(inner=comp)
     graph.nodes[node_id] = node
@@ -97,16 +164,10 @@ def delete_node(graph: Graph, node_id: str) -> None:
 
     # Collect connected components that need stopping
     affected: set[str] = set()
-    for edge in graph.edges:
-        if edge.source_node == node_id:
-            affected.add(edge.target_node)
-        if edge.target_node == node_id:
-            affected.add(edge.source_node)
-
-    graph.edges = [
-        e for e in graph.edges
-        if e.source_node != node_id and e.target_node != node_id
-    ]
+    for edge in graph.remove_node_edges(node_id):
+        affected.add(edge.source_node)
+        affected.add(edge.target_node)
+    affected.discard(node_id)
 
     for affected_id in affected:
         affected_node = graph.nodes.get(affected_id)
@@ -153,10 +214,10 @@ def create_edge(
         target_slot=target_slot,
     )
 
-    if edge in graph.edges:
+    if graph.has_edge(edge):
         raise ValueError(f"Edge already exists: {edge}")
 
-    graph.edges.append(edge)
+    graph.add_edge(edge)
     _auto_save(graph)
 
 
@@ -175,7 +236,7 @@ def delete_edge(
     )
 
     try:
-        graph.edges.remove(edge)
+        graph.remove_edge(edge)
         # Stop connected components
         for nid in (source_node, target_node):
             node = graph.nodes.get(nid)
@@ -187,15 +248,16 @@ def delete_edge(
 
 
 def start_all(graph: Graph) -> None:
-    comp_inputs: dict[str, dict[str, Channel[Any]]] = {nid: {} for nid in graph.nodes}
-
-    for edge in graph.edges:
-        source = graph.nodes[edge.source_node].inner
-        channel = source.get_output_channels()[edge.source_slot]
-        comp_inputs[edge.target_node][edge.target_slot] = channel
-
+    # get_output_channels() once per source node, however many edges fan out of it.
+    outputs: dict[str, Mapping[str, Channel[Any]]] = {}
     for node_id, node in graph.nodes.items():
-        node.inner.start(**comp_inputs[node_id])
+        inputs: dict[str, Channel[Any]] = {}
+        for edge in graph.inputs_of(node_id):
+            channels = outputs.get(edge.source_node)
+            if channels is None:
+                channels = outputs[edge.source_node] = graph.nodes[edge.source_node].inner.get_output_channels()
+            inputs[edge.target_slot] = channels[edge.source_slot]
+        node.inner.start(**inputs)
 
 
 def stop_all(graph: Graph) -> None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncGenerator
 
+import msgspec
 from fastapi import APIRouter, Depends
 from sse_starlette.sse import EventSourceResponse
 
@@ -12,10 +13,13 @@ from src.api.metrics import service
 
 router = APIRouter(prefix="/metrics")
 
+_ENC = msgspec.json.Encoder()
+
 
 async def _stream(graph: Graph) -> AsyncGenerator[str, None]:
     while True:
-        yield service.collect(graph).model_dump_json()
+        # EventSourceResponse passes bytes through unframed, so hand it a str.
+        yield _ENC.encode(service.collect(graph)).decode()
         await asyncio.sleep(0.1)
 
 
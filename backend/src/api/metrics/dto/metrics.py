@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+import msgspec
 
 from src.core.component import ComponentSnapshot
 
 
-class MetricsResponse(BaseModel):
+class MetricsResponse(msgspec.Struct, gc=False):
     nodes: dict[str, ComponentSnapshot]
     timestamp: float
@@ -3,21 +3,45 @@ from __future__ import annotations
 import sys
 import threading
 import time
+from queue import Empty, SimpleQueue
 from typing import TYPE_CHECKING, Generator
 
-from pydantic import BaseModel
+import msgspec
 
 if TYPE_CHECKING:
     from src.core.component import Component
 
 
-class SubscriberSnapshot(BaseModel):
+def _bsize(item: object, _sizeof=sys.getsizeof, _buffers=(bytes, bytearray, memoryview)) -> int:
+    """Cheap byte estimate for telemetry: payload length for buffers and arrays, else sys.getsizeof."""
+    if isinstance(item, _buffers):
+        return len(item)
+    nbytes = getattr(item, "nbytes", None)
+    return nbytes if isinstance(nbytes, int) else _sizeof(item)
+
+
+class _Subscriber[T]:
+    """One subscriber's queue plus cumulative counters, written only by the subscriber's own thread."""
+
+    __slots__ = ("byte_count", "msg_count", "queue", "reported_bytes", "reported_msgs")
+
+    def __init__(self) -> None:
+        # Items are queued with their byte size, measured once on send.
+        self.queue: SimpleQueue[tuple[T, int]] = SimpleQueue()
+        self.msg_count = 0
+        self.byte_count = 0
+        self.reported_msgs = 0
+        self.reported_bytes = 0
+
+
+# Snapshots are short-lived and acyclic, so they opt out of GC tracking.
+class SubscriberSnapshot(msgspec.Struct, gc=False):
     lag: int
     msg_count_delta: int
     byte_count_delta: int
 
 
-class ChannelSnapshot(BaseModel):
+class ChannelSnapshot(msgspec.Struct, gc=False):
     name: str
     msg_count_delta: int
     byte_count_delta: int
@@ -29,51 +53,60 @@ class ChannelSnapshot(BaseModel):
 class Channel[T]:
 
     def __init__(self, *, name: str | None = None) -> None:
-        self._items: list[T] = []
-        self._offset = 0
-        self._condition = threading.Condition()
-        self._cursors: dict[int, int] = {}
-        self._sub_msg_count_delta: dict[int, int] = {}
-        self._sub_byte_count_delta: dict[int, int] = {}
+        # Guards subscriber registration and the channel counters; send() reads the _fanout
+        # tuple without locking.
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, _Subscriber[T]] = {}
+        self._fanout: tuple[_Subscriber[T], ...] = ()
         self.name: str = name or f"channel_{id(self):x}"
-        self._msg_count_delta: int = 0
-        self._byte_count_delta: int = 0
-        self._last_send_time: float = 0.0
+        # Cumulative counters; snapshot() reports the change since the previous snapshot.
+        self._msg_count: int = 0
+        self._byte_count: int = 0
+        self._reported_msgs: int = 0
+        self._reported_bytes: int = 0
+        # monotonic_ns of the last send, or 0; snapshot() converts it to wall-clock time.
+        self._last_send_ns: int = 0
 
     def send(self, item: T) -> None:
-        with self._condition:
-            if not self._cursors: # stop data from accumulating when no one is listening
-                return
-            self._items.append(item)
-            self._msg_count_delta += 1
-            self._byte_count_delta += sys.getsizeof(item)
-            self._last_send_time = time.time()
-            self._condition.notify_all()
+        """Safe to call from several producer threads."""
+        fanout = self._fanout
+        if not fanout: # stop data from accumulating when no one is listening
+            return
+        size = _bsize(item)
+        entry = (item, size)
+        for sub in fanout:
+            sub.queue.put(entry)
+        with self._lock:
+            self._msg_count += 1
+            self._byte_count += size
+            self._last_send_ns = time.monotonic_ns()
 
     def snapshot(self) -> ChannelSnapshot:
-        with self._condition:
-            total = self._offset + len(self._items)
-            subs = {
-                str(sub_id): SubscriberSnapshot(
-                    lag=total - cursor,
-                    msg_count_delta=self._sub_msg_count_delta.get(sub_id, 0),
-                    byte_count_delta=self._sub_byte_count_delta.get(sub_id, 0),
-                )
-                for sub_id, cursor in self._cursors.items()
-            }
-            msg_count_delta = self._msg_count_delta
-            byte_count_delta = self._byte_count_delta
-            buffer_depth = len(self._items)
-            self._msg_count_delta = 0
-            self._byte_count_delta = 0
-            for sub_id in self._sub_msg_count_delta:
-                self._sub_msg_count_delta[sub_id] = 0
-                self._sub_byte_count_delta[sub_id] = 0
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+            msg_count, byte_count = self._msg_count, self._byte_count
+            msg_count_delta = msg_count - self._reported_msgs
+            byte_count_delta = byte_count - self._reported_bytes
+            self._reported_msgs, self._reported_bytes = msg_count, byte_count
+            last_send_ns = self._last_send_ns
+        subs: dict[str, SubscriberSnapshot] = {}
+        buffer_depth = 0
+        for sub_id, sub in subscribers:
+            lag = sub.queue.qsize()
+            buffer_depth = max(buffer_depth, lag)
+            msg_count, byte_count = sub.msg_count, sub.byte_count
+            subs[str(sub_id)] = SubscriberSnapshot(
+                lag=lag,
+                msg_count_delta=msg_count - sub.reported_msgs,
+                byte_count_delta=byte_count - sub.reported_bytes,
+            )
+            sub.reported_msgs, sub.reported_bytes = msg_count, byte_count
+        last_send_time = time.time() - (time.monotonic_ns() - last_send_ns) / 1e9 if last_send_ns else 0.0
         return ChannelSnapshot(
             name=self.name,
             msg_count_delta=msg_count_delta,
             byte_count_delta=byte_count_delta,
-            last_send_time=self._last_send_time,
+            last_send_time=last_send_time,
             buffer_depth=buffer_depth,
             subscribers=subs,
         )
@@ -81,51 +114,32 @@ class Channel[T]:
     def stream(self, subscriber: Component[..., ...]) -> Generator[T | None, None, None]:
         """On GeneratorExit, stream is unregistered."""
         stop_event = subscriber.stop_event
-        sub_id = self._register(subscriber)
+        sub_id, sub = self._register(subscriber)
+        get = sub.queue.get
         try:
             while not stop_event.is_set():
-                item = self._wait_and_get(sub_id, stop_event)
+                try:
+                    item, size = get(timeout=0.1)
+                except Empty:
+                    continue
+                sub.msg_count += 1
+                sub.byte_count += size
                 yield item
             yield None
         finally:
             self._unregister(sub_id)
 
-    def _register(self, subscriber: Component[..., ...]) -> int:
+    def _register(self, subscriber: Component[..., ...]) -> tuple[int, _Subscriber[T]]:
         sub_id = id(subscriber)
-        with self._condition:
-            self._cursors[sub_id] = self._offset + len(self._items)
-            self._sub_msg_count_delta[sub_id] = 0
-            self._sub_byte_count_delta[sub_id] = 0
-            return sub_id
-
-    def _wait_and_get(self, sub_id: int, stop_event: threading.Event) -> T | None:
-        with self._condition:
-            index = self._cursors[sub_id]
-            while index >= self._offset + len(self._items):
-                self._condition.wait(0.1)
-                if stop_event.is_set():
-                    return None
-            item = self._items[index - self._offset]
-            self._cursors[sub_id] = index + 1
-            self._sub_msg_count_delta[sub_id] = self._sub_msg_count_delta.get(sub_id, 0) + 1
-            self._sub_byte_count_delta[sub_id] = self._sub_byte_count_delta.get(sub_id, 0) + sys.getsizeof(item)
-            self._gc()
-        return item
+        sub: _Subscriber[T] = _Subscriber()
+        with self._lock:
+            self._subscribers[sub_id] = sub
+            self._fanout = tuple(self._subscribers.values())
+        return sub_id, sub
 
     def _unregister(self, sub_id: int) -> None:
         """Idempotent."""
-        with self._condition:
-            if sub_id not in self._cursors:
+        with self._lock:
+            if self._subscribers.pop(sub_id, None) is None:
                 return None
-            self._cursors.pop(sub_id)
-            self._sub_msg_count_delta.pop(sub_id, None)
-            self._sub_byte_count_delta.pop(sub_id, None)
-            self._gc()
-
-    def _gc(self) -> None:
-        if not self._cursors:
-            return
-        drop = min(self._cursors.values()) - self._offset
-        if drop > 0:
-            del self._items[:drop]
-            self._offset += drop
+            self._fanout = tuple(self._subscribers.values())
@@ -6,9 +6,9 @@ import time
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from enum import Enum
-from typing import Any, get_type_hints
+from typing import Any, ClassVar, get_type_hints
 
-from pydantic import BaseModel
+import msgspec
 
 from src.core.channel import ChannelSnapshot
 
@@ -16,7 +16,7 @@ from src.core.channel import ChannelSnapshot
 from src.core.config import BaseConfig
 
 
-class ComponentSnapshot(BaseModel):
+class ComponentSnapshot(msgspec.Struct, gc=False):
     name: str
     status: str
     started_at: float | None
@@ -31,9 +31,24 @@ class Status(Enum):
 
 
 class Component[**P, O: Mapping[str, Any]](ABC):
+    _registry_version: ClassVar[int] = 0
+    _registry: ClassVar[dict[str, type[Component[..., Any]]] | None] = None
+    _registry_snapshot: ClassVar[tuple[tuple[str, type[Component[..., Any]]], ...] | None] = None
+    # Per-class introspection caches; looked up in cls.__dict__ so subclasses never see a parent's entry.
+    _init_types: ClassVar[dict[str, type]]
+    _input_types: ClassVar[dict[str, type]]
+    _output_types: ClassVar[dict[str, type]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Component._registry_version += 1
+        Component._registry = None
+        Component._registry_snapshot = None
+
     def __init__(self, config: BaseConfig | None = None) -> None:
         self.name: str = type(self).__name__
         self._status = Status.STARTUP
+        self.status_value: str = self._status.value
         self._started_at: float | None = None
         self._error: str | None = None
         self._thread: threading.Thread | None = None
@@ -48,6 +63,11 @@ class Component[**P, O: Mapping[str, Any]](ABC):
     def stop_event(self) -> threading.Event:
         return self._stop_event
 
+    def _set_status(self, status: Status) -> None:
+        """Updates status and the cached status_value string read by API pollers."""
+        self._status = status
+        self.status_value = status.value
+
     @abstractmethod
     def run(self, *args: P.args, **kwargs: P.kwargs) -> None: ...
 
@@ -55,12 +75,12 @@ class Component[**P, O: Mapping[str, Any]](ABC):
     def get_output_channels(self) -> O: ...
 
     def _safe_run(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        self._status = Status.RUNNING
+        self._set_status(Status.RUNNING)
         self._started_at = time.time()
         try:
             self.run(*args, **kwargs)
         finally:
-            self._status = Status.STOPPED
+            self._set_status(Status.STOPPED)
 
     def start(self, *args: P.args, **kwargs: P.kwargs) -> None:
         if self.status == Status.RUNNING:
@@ -83,7 +103,7 @@ class Component[**P, O: Mapping[str, Any]](ABC):
     def snapshot(self) -> ComponentSnapshot:
         return ComponentSnapshot(
             name=self.name,
-            status=self.status.value,
+            status=self.status_value,
             started_at=self._started_at,
             channels={n: ch.snapshot() for n, ch in self.get_output_channels().items()},
             config=self.config.to_dict(),
@@ -91,26 +111,38 @@ class Component[**P, O: Mapping[str, Any]](ABC):
 
     @classmethod
     def get_init_types(cls) -> dict[str, type]:
-        """Returns {param_name: type} from __init__, excluding self."""
-        hints = get_type_hints(cls.__init__)
-        hints.pop("return", None)
-        return hints
+        """Returns {param_name: type} from __init__, excluding self. Cached per class; do not mutate."""
+        cached = cls.__dict__.get("_init_types")
+        if cached is None:
+            cached = get_type_hints(cls.__init__)
+            cached.pop("return", None)
+            cls._init_types = cached
+        return cached
 
     @classmethod
     def get_input_types(cls) -> dict[str, type]:
-        """Introspect run()'s keyword params for input channel types."""
-        hints = get_type_hints(cls.run)
-        hints.pop("return", None)
-        return hints
+        """Introspect run()'s keyword params for input channel types. Cached per class; do not mutate."""
+        cached = cls.__dict__.get("_input_types")
+        if cached is None:
+            cached = get_type_hints(cls.run)
+            cached.pop("return", None)
+            cls._input_types = cached
+        return cached
 
     @classmethod
     def get_output_types(cls) -> dict[str, type]:
-        """Introspect get_output_channels()'s return type (TypedDict) for output types."""
-        hints = get_type_hints(cls.get_output_channels)
-        td = hints.get("return")
-        if td is None:
-            return {}
-        return get_type_hints(td)
+        """Introspect get_output_channels()'s return type (TypedDict) for output types. Cached per class; do not mutate."""
+        cached = cls.__dict__.get("_output_types")
+        if cached is None:
+            td = get_type_hints(cls.get_output_channels).get("return")
+            cached = get_type_hints(td) if td is not None else {}
+            cls._output_types = cached
+        return cached
+
+    @classmethod
+    def registry_version(cls) -> int:
+        """Bumped whenever a new subclass is defined, so registry-derived caches know to rebuild."""
+        return Component._registry_version
 
     @classmethod
     def registered_subclasses(cls) -> dict[str, type[Component[..., Any]]]:
@@ -129,3 +161,21 @@ class Component[**P, O: Mapping[str, Any]](ABC):
             walk(child)
 
         return result
+
+    @classmethod
+    def registry(cls) -> dict[str, type[Component[..., Any]]]:
+        """Cached registered_subclasses() of Component; dropped whenever a new subclass is defined. Do not mutate."""
+        registry = Component._registry
+        if registry is None:
+            registry = Component.registered_subclasses()
+            Component._registry = registry
+        return registry
+
+    @classmethod
+    def registry_snapshot(cls) -> tuple[tuple[str, type[Component[..., Any]]], ...]:
+        """Cached (name, class) pairs of all concrete subclasses; dropped whenever a new subclass is defined."""
+        snapshot = Component._registry_snapshot
+        if snapshot is None:
+            snapshot = tuple(Component.registry().items())
+            Component._registry_snapshot = snapshot
+        return snapshot
@@ -32,6 +32,10 @@ class AgentState(Component[[Channel[TextFrame], Channel[TextFrame], Channel[Inte
         
         # Conversation history as list of (speaker, text) tuples
         self._history: list[tuple[str, str]] = []
+        # _history pre-rendered as prompt lines and chat messages, kept in step so each turn renders
+        # only the new entry. Message dicts are replaced, never mutated, as sent frames share them.
+        self._context_lines: list[str] = []
+        self._messages: list[dict[str, str]] = []
         self._lock = threading.Lock()
 
     def get_output_channels(self) -> AgentStateOutputs:
@@ -40,23 +44,29 @@ class AgentState(Component[[Channel[TextFrame], Channel[TextFrame], Channel[Inte
             "interrupt": self._output_interrupt
         }
 
-    def _build_context(self) -> str:
-        """Build single prompt string."""
-        with self._lock:
-            lines = [self.config.system_prompt, "***"]
-            for name, text in self._history:
-                lines.append(f"{name}: {text}")
-            lines.append(f"{self.config.chatbot_name}:")
-            return "\n".join(lines)
-
-    def _build_messages(self) -> list[dict[str, str]]:
-        """Build message list for Chat APIs."""
-        with self._lock:
-            messages = [{"role": "system", "content": self.config.system_prompt}]
-            for name, text in self._history:
-                role = "user" if name == self.config.user_name else "assistant"
-                messages.append({"role": role, "content": text})
-            return messages
+    def _render(self, name: str, text: str) -> tuple[str, dict[str, str]]:
+        role = "user" if name == self.config.user_name else "assistant"
+        return f"{name}: {text}", {"role": role, "content": text}
+
+    def _append_turn(self, name: str, text: str) -> None:
+        """Caller holds self._lock."""
+        line, message = self._render(name, text)
+        self._history.append((name, text))
+        self._context_lines.append(line)
+        self._messages.append(message)
+
+    def _replace_last_turn(self, name: str, text: str) -> None:
+        """Caller holds self._lock."""
+        line, message = self._render(name, text)
+        self._history[-1] = (name, text)
+        self._context_lines[-1] = line
+        self._messages[-1] = message
+
+    def _snapshot_prompt(self) -> tuple[list[str], list[dict[str, str]]]:
+        """Caller holds self._lock. Returns the prompt lines and chat messages; only copies lists."""
+        lines = [self.config.system_prompt, "***", *self._context_lines, f"{self.config.chatbot_name}:"]
+        messages = [{"role": "system", "content": self.config.system_prompt}, *self._messages]
+        return lines, messages
 
     def run(
         self, 
@@ -74,16 +84,19 @@ class AgentState(Component[[Channel[TextFrame], Channel[TextFrame], Channel[Inte
                 text = text_frame.get().strip()
                 if not text: continue
                     
+                # One critical section for the append and the snapshot, so the prompt always
+                # ends with this turn.
                 with self._lock:
-                    self._history.append((self.config.user_name, text))
+                    self._append_turn(self.config.user_name, text)
+                    lines, messages = self._snapshot_prompt()
                 
                 print(f"[AgentState] User: {text}")
                 
                 # Output context as MessagesFrame
                 self._output_messages.send(MessagesFrame(
                     display_name="agent_state",
-                    text=self._build_context(),
-                    messages=self._build_messages(),
+                    text="\n".join(lines),
+                    messages=messages,
                     pts=text_frame.pts
                 ))
 
@@ -99,9 +112,9 @@ class AgentState(Component[[Channel[TextFrame], Channel[TextFrame], Channel[Inte
                     # Append or start new assistant message
                     if self._history and self._history[-1][0] == self.config.chatbot_name:
                         name, text = self._history[-1]
-                        self._history[-1] = (name, text + chunk)
+                        self._replace_last_turn(name, text + chunk)
                     else:
-                        self._history.append((self.config.chatbot_name, chunk))
+                        self._append_turn(self.config.chatbot_name, chunk)
 
         def process_interrupts():
             if not interrupt: return
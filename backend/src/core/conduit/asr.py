@@ -1,30 +1,67 @@
 from __future__ import annotations
 
+import io
+import logging
 import os
-import tempfile
+import struct
 import threading
 import traceback
-import wave
 import time
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from queue import Queue, Empty
-from typing import TypedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from queue import Empty, Queue
+from typing import Any, Literal, TypedDict
 
 import numpy as np
+import orjson
 import requests
+import soundfile as sf
 
-from src.core.component import Component
+from src.core.component import Component, Status
 from src.core.channel import Channel
 from src.core.frames import AudioFrame, InterruptFrame, TextFrame, AudioDataFormat
 from src.core.config import BaseConfig
 
+logger = logging.getLogger(__name__)
+
+
+# RIFF/WAVE header for 16 kHz mono PCM16; only the two size fields vary.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+@lru_cache(maxsize=64)
+def _wav_header(data_size: int) -> bytes:
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, 16000, 16000 * 2, 2, 16,
+        b"data", data_size,
+    )
+
+
+class _Stop(Enum):
+    """Queued by stop() to shut the worker and emitter threads down."""
+    STOP = "stop"
+
+
+_STOP = _Stop.STOP
+
 
 class ASRConfig(BaseConfig):
     groq_api_key: str | None = None
     model: str = "whisper-large-v3-turbo"
     language: str = "en"
     timeout: int = 60
+    max_concurrent_requests: int = 4
+    # FLAC roughly halves the upload; "wav" sends uncompressed PCM16.
+    upload_format: Literal["flac", "wav"] = "flac"
+    # Keep a copy of every upload under debug/.
+    debug_audio: bool = False
+    # Segments whose PCM16 RMS is below this are treated as silence and not uploaded; 0 disables.
+    # Off by default: the VAD has already classified segments as speech, and quiet speakers
+    # would be dropped. Around 150 (-47 dBFS) gates only near-silent segments.
+    min_rms: int = 0
 
 
 class ASROutputs(TypedDict):
@@ -44,9 +81,17 @@ class ASR(Component[[Channel[AudioFrame], Channel[InterruptFrame]], ASROutputs])
             raise ValueError("GROQ_API_KEY must be provided either as parameter or environment variable")
         
         self._url = "https://api.groq.com/openai/v1/audio/transcriptions"
+        # Keep-alive session so back-to-back segments reuse the TLS connection.
+        self._session = requests.Session()
+        self._session.headers["Authorization"] = f"Bearer {self._api_key}"
+
+        self._debug_dir = Path("debug")
+        if self.config.debug_audio:
+            self._debug_dir.mkdir(exist_ok=True)
         
-        self._task_queue: Queue[AudioFrame] = Queue()
+        self._task_queue: Queue[AudioFrame | _Stop] = Queue()
         self._worker_thread: threading.Thread | None = None
+        self._emitter_thread: threading.Thread | None = None
 
     def get_output_channels(self) -> ASROutputs:
         return {
@@ -54,102 +99,130 @@ class ASR(Component[[Channel[AudioFrame], Channel[InterruptFrame]], ASROutputs])
             "interrupt": self._output_interrupt,
         }
 
-    def _prepare_audio_for_transcription(self, frame: AudioFrame) -> str:
-        # Whisper prefers 16kHz mono PCM16
-        pcm_16k = frame.get(sample_rate=16000, num_channels=1, data_format=AudioDataFormat.PCM16)
-
-        temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_path = temp_file.name
-        temp_file.close()
-
-        try:
-            with wave.open(temp_path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(16000)
-                wf.writeframes(pcm_16k)
-            return temp_path
-        except Exception as e:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise e
-
-    def _save_debug_audio(self, wav_path: str) -> None:
-        """Save a copy of the audio file to the debug directory."""
-        debug_dir = Path("debug")
-        debug_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        debug_path = debug_dir / f"groq_audio_{timestamp}.wav"
-        
+    def _is_silent(self, pcm_16k: bytes) -> bool:
+        if self.config.min_rms <= 0 or not pcm_16k:
+            return False
+        samples = np.frombuffer(pcm_16k, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.dot(samples, samples) / samples.size))
+        if rms >= self.config.min_rms:
+            return False
+        logger.debug("Skipping %d ms segment: RMS %.1f below min_rms %d", len(pcm_16k) // 32, rms, self.config.min_rms)
+        return True
+
+    def _prepare_audio_for_transcription(self, pcm_16k: bytes) -> tuple[str, bytes, str]:
+        """Returns (filename, data, content type) for the upload."""
+        if self.config.upload_format == "flac":
+            buf = io.BytesIO()
+            sf.write(buf, np.frombuffer(pcm_16k, dtype=np.int16), 16000, format="FLAC", subtype="PCM_16")
+            return "audio.flac", buf.getvalue(), "audio/flac"
+        return "audio.wav", _wav_header(len(pcm_16k)) + pcm_16k, "audio/wav"
+
+    def _save_debug_audio(self, filename: str, audio: bytes) -> None:
+        """Save a copy of the uploaded audio to the debug directory."""
+        debug_path = self._debug_dir / f"groq_audio_{time.time_ns()}{Path(filename).suffix}"
         try:
-            with open(wav_path, 'rb') as src, open(debug_path, 'wb') as dst:
-                dst.write(src.read())
+            debug_path.write_bytes(audio)
             print(f"[ASR] Debug audio saved to: {debug_path}")
         except Exception as e:
             print(f"[ASR] Failed to save debug audio: {e}")
 
     def _transcribe_audio(self, frame: AudioFrame) -> TextFrame | None:
         try:
-            wav_path = self._prepare_audio_for_transcription(frame)
-            try:
-                # # Save debug audio before sending to Groq
-                # self._save_debug_audio(wav_path)
-                
-                headers = {"Authorization": f"Bearer {self._api_key}"}
-                data = {
-                    "model": self.config.model,
-                    "language": self.config.language,
-                    "response_format": "json"
-                }
-                
-                with open(wav_path, "rb") as audio_file:
-                    files = {"file": ("audio.wav", audio_file, "audio/wav")}
-                    response = requests.post(
-                        self._url,
-                        headers=headers,
-                        files=files,
-                        data=data,
-                        timeout=self.config.timeout
-                    )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                text = result.get("text", "").strip()
-                if text:
-                    print(f"[ASR] Transcription: '{text}'")
-                    return TextFrame(
-                        display_name="asr_transcription",
-                        text=text,
-                        language=self.config.language,
-                        pts=frame.pts
-                    )
+            # Whisper prefers 16kHz mono PCM16
+            pcm_16k = frame.get(sample_rate=16000, num_channels=1, data_format=AudioDataFormat.PCM16)
+            if self._is_silent(pcm_16k):
+                # Skips the round trip, and Whisper tends to hallucinate text on silence anyway.
                 return None
-            finally:
-                if os.path.exists(wav_path):
-                    os.unlink(wav_path)
+            upload = self._prepare_audio_for_transcription(pcm_16k)
+            if self.config.debug_audio:
+                self._save_debug_audio(upload[0], upload[1])
+
+            data = {
+                "model": self.config.model,
+                "language": self.config.language,
+                "response_format": "json"
+            }
+
+            files = {"file": upload}
+            response = self._session.post(
+                self._url,
+                files=files,
+                data=data,
+                timeout=self.config.timeout
+            )
+
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            text = result.get("text", "").strip()
+            if text:
+                print(f"[ASR] Transcription: '{text}'")
+                return TextFrame(
+                    display_name="asr_transcription",
+                    text=text,
+                    language=self.config.language,
+                    pts=frame.pts
+                )
+            return None
         except Exception as e:
             print(f"[ASR] Transcription error: {e}")
             return None
 
-    def _worker_loop(self) -> None:
-        while not self.stop_event.is_set():
+    def start(self, *args: Any, **kwargs: Any) -> None:
+        if self.status == Status.RUNNING:
+            return
+        # Fresh queue before the thread exists, so a stop() right after start() reaches this run.
+        self._task_queue = Queue()
+        super().start(*args, **kwargs)
+
+    def stop(self) -> None:
+        super().stop()
+        # Wake the blocked worker; it passes the sentinel on to the emitter.
+        self._task_queue.put(_STOP)
+
+    def _next[T](self, queue: Queue[T | _Stop]) -> T | _Stop:
+        """Next item from queue, or _STOP once stop is set even if no sentinel arrives."""
+        while True:
             try:
-                frame = self._task_queue.get(timeout=0.1)
-                text_frame = self._transcribe_audio(frame)
-                if text_frame:
-                    self._output_text.send(text_frame)
+                return queue.get(timeout=0.5)
             except Empty:
-                continue
+                if self.stop_event.is_set():
+                    return _STOP
+
+    def _worker_loop(
+        self,
+        tasks: Queue[AudioFrame | _Stop],
+        pending: Queue[Future[TextFrame | None] | _Stop],
+        pool: ThreadPoolExecutor,
+    ) -> None:
+        """Submits each segment to the pool so several uploads can be in flight at once."""
+        while (frame := self._next(tasks)) is not _STOP:
+            pending.put(pool.submit(self._transcribe_audio, frame))
+        pending.put(_STOP)
+
+    def _emit_loop(self, pending: Queue[Future[TextFrame | None] | _Stop]) -> None:
+        """Sends transcriptions in segment order, however the requests finish."""
+        while (future := self._next(pending)) is not _STOP:
+            if self.stop_event.is_set():
+                continue  # drain to the sentinel without waiting on in-flight requests
+            try:
+                text_frame = future.result()
             except Exception as e:
                 print(f"[ASR] Worker error: {e}")
                 continue
+            if text_frame:
+                self._output_text.send(text_frame)
 
     def run(self, audio: Channel[AudioFrame] | None = None, interrupt: Channel[InterruptFrame] | None = None) -> None:
         print("[ASR] Starting Automatic Speech Recognition")
-        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        # This run's queues, held as locals so a later start() can't swap them underneath it.
+        tasks = self._task_queue
+        pending: Queue[Future[TextFrame | None] | _Stop] = Queue()
+        pool = ThreadPoolExecutor(max_workers=self.config.max_concurrent_requests, thread_name_prefix="asr")
+        self._worker_thread = threading.Thread(target=self._worker_loop, args=(tasks, pending, pool), daemon=True)
         self._worker_thread.start()
+        self._emitter_thread = threading.Thread(target=self._emit_loop, args=(pending,), daemon=True)
+        self._emitter_thread.start()
         
         if interrupt:
             def passthrough():
@@ -167,10 +240,13 @@ class ASR(Component[[Channel[AudioFrame], Channel[InterruptFrame]], ASROutputs])
                     
                     # Handle speech segments from VAD
                     if frame.display_name == "vad_speech_segment":
-                        self._task_queue.put(frame)
+                        tasks.put(frame)
             finally:
                 pass
         
         if self._worker_thread and self._worker_thread.is_alive():
             self._worker_thread.join(timeout=1.0)
+        if self._emitter_thread and self._emitter_thread.is_alive():
+            self._emitter_thread.join(timeout=1.0)
+        pool.shutdown(wait=False, cancel_futures=True)
         print("[ASR] Automatic Speech Recognition stopped")
@@ -21,6 +21,8 @@ _discord_loop: asyncio.AbstractEventLoop | None = None
 _discord_thread: threading.Thread | None = None
 _discord_running = False
 _discord_lock = threading.Lock()
+# How long a new DiscordIO waits for the bot thread to finish setting up.
+_DISCORD_READY_TIMEOUT = 30.0
 
 
 class DiscordConfig(BaseConfig):
@@ -67,18 +69,28 @@ class DiscordIO(Component[[Channel[AudioFrame], Channel[InterruptFrame]], Discor
             if _discord_running:
                 return
             
+            # Set by the bot thread once setup has finished or failed; failures go in setup_error.
+            ready = threading.Event()
+            setup_error: list[Exception] = []
+            
             def run_discord():
                 global _discord_bot, _discord_loop, _discord_running
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                _discord_loop = loop
-                
-                intents = discord.Intents.default()
-                bot = discord.Bot(intents=intents)
-                _discord_bot = bot
-                self._register_handlers_for_bot(bot)
-                
-                _discord_running = True
+                try:
+                    loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(loop)
+                    _discord_loop = loop
+                    
+                    intents = discord.Intents.default()
+                    bot = discord.Bot(intents=intents)
+                    _discord_bot = bot
+                    self._register_handlers_for_bot(bot)
+                    
+                    _discord_running = True
+                except Exception as e:
+                    setup_error.append(e)
+                    return
+                finally:
+                    ready.set()
                 try:
                     loop.run_until_complete(bot.start(self.token))
                 except Exception as e:
@@ -90,8 +102,10 @@ class DiscordIO(Component[[Channel[AudioFrame], Channel[InterruptFrame]], Discor
             _discord_thread.start()
             
             # Wait for bot
-            while _discord_bot is None:
-                threading.Event().wait(0.1)
+            if not ready.wait(timeout=_DISCORD_READY_TIMEOUT):
+                raise RuntimeError(f"Discord bot thread did not finish setup within {_DISCORD_READY_TIMEOUT:g}s")
+            if setup_error:
+                raise RuntimeError("Discord bot setup failed") from setup_error[0]
 
     def _register_handlers_for_bot(self, bot: discord.Bot) -> None:
         @bot.event
@@ -157,6 +171,8 @@ class DiscordIO(Component[[Channel[AudioFrame], Channel[InterruptFrame]], Discor
         if audio:
             for frame in audio.stream(self):
                 if frame is None: break
+                # Nobody to play to: skip the resample
+                if not self._buffer: continue
                 
                 # Use AudioFrame.get for resampling/reformatting
                 pcm_data = frame.get(
@@ -185,18 +201,30 @@ class _DiscordSink(Sink):
 
 
 class _DiscordAudioSource(discord.AudioSource):
+    _FRAME_BYTES = 3840  # 20ms at 48kHz stereo pcm16
+    _SILENCE = b"\x00" * _FRAME_BYTES
+
     def __init__(self, buffer: deque[bytes]):
         self.buffer = buffer
-        self._current = b""
+        # Pending PCM; bytes before _head are already played and are compacted away lazily.
+        self._current = bytearray()
+        self._head = 0
     
     def read(self) -> bytes:
-        target = 3840  # 20ms at 48kHz stereo pcm16
-        while len(self._current) < target and self.buffer:
-            self._current += self.buffer.popleft()
-        if not self._current:
-            return b"\x00" * target
-        chunk = self._current[:target]
-        self._current = self._current[target:]
+        target = self._FRAME_BYTES
+        current = self._current
+        while len(current) - self._head < target and self.buffer:
+            current += self.buffer.popleft()
+        if self._head >= len(current):
+            return self._SILENCE
+        chunk = bytes(current[self._head:self._head + target])
+        self._head += target
+        if self._head >= len(current):
+            current.clear()
+            self._head = 0
+        elif self._head > 65536:
+            del current[:self._head]
+            self._head = 0
         if len(chunk) < target:
-            chunk += b"\x00" * (target - len(chunk))
+            chunk += self._SILENCE[len(chunk):]
         return chunk
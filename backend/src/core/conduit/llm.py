@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
+import time
 from queue import Empty, Queue
 from typing import TypedDict
 
+import orjson
 import requests
 
 from src.core.component import Component
@@ -15,6 +16,11 @@ from src.core.config import BaseConfig
 
 GENERATE_END_FLAG = "[END_OF_GENERATE]"
 
+# Streamed deltas are coalesced into one TextFrame until this much time has passed
+# since the last send, or until a delta ends on a word or sentence boundary.
+_FLUSH_INTERVAL = 0.015
+_FLUSH_ENDINGS = (" ", ".", ",", "!", "?", "\n")
+
 
 class LLMConfig(BaseConfig):
     url: str = "https://api.groq.com/openai/v1/chat/completions"
@@ -22,6 +28,8 @@ class LLMConfig(BaseConfig):
     top_p: float = 0.97
     temperature: float = 1.08
     max_tokens: int = 350
+    # Past user/assistant exchanges sent with each request, besides the system prompt.
+    max_turns: int = 16
 
 
 class LLMOutputs(TypedDict):
@@ -45,6 +53,12 @@ class LLM(Component[[Channel[MessagesFrame], Channel[InterruptFrame]], LLMOutput
         # Task queue for worker thread
         self._task_queue: Queue[tuple[int, MessagesFrame]] = Queue()
 
+        # Keep-alive session so each turn reuses the TLS connection.
+        self._session = requests.Session()
+
+        # Pre-serialized history messages, keyed by their content.
+        self._fragments: dict[tuple[tuple[str, str], ...], orjson.Fragment] = {}
+
     def get_output_channels(self) -> LLMOutputs:
         return {
             "text": self._output_text,
@@ -104,6 +118,32 @@ class LLM(Component[[Channel[MessagesFrame], Channel[InterruptFrame]], LLMOutput
         worker_thread.join(timeout=1)
         print("[LLM] LLM generation stopped")
 
+    def _trim_history(self, messages: list[dict[str, str]]) -> list[dict[str, str]]:
+        """Keeps the system prompt, the last max_turns exchanges and the current user message; a trimmed history starts at a user turn."""
+        head = messages[:1] if messages and messages[0].get("role") == "system" else []
+        body = messages[len(head):]
+        keep = 2 * self.config.max_turns + 1
+        if len(body) <= keep:
+            return messages
+        tail = body[len(body) - keep:]
+        start = next((i for i, m in enumerate(tail) if m.get("role") == "user"), 0)
+        return head + tail[start:]
+
+    def _encode_messages(self, messages: list[dict[str, str]]) -> list[orjson.Fragment]:
+        """Serializes only messages not seen in the previous request; the cache keeps just this request's."""
+        cache = self._fragments
+        fragments: dict[tuple[tuple[str, str], ...], orjson.Fragment] = {}
+        encoded: list[orjson.Fragment] = []
+        for message in messages:
+            key = tuple(message.items())
+            fragment = cache.get(key)
+            if fragment is None:
+                fragment = orjson.Fragment(orjson.dumps(message))
+            fragments[key] = fragment
+            encoded.append(fragment)
+        self._fragments = fragments
+        return encoded
+
     def _process_generation(self, gen: int, frame: MessagesFrame) -> None:
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
@@ -117,7 +157,7 @@ class LLM(Component[[Channel[MessagesFrame], Channel[InterruptFrame]], LLMOutput
         
         payload = {
             "model": self.config.model_id,
-            "messages": frame.get(MessagesDataFormat.MESSAGES),
+            "messages": self._encode_messages(self._trim_history(frame.get(MessagesDataFormat.MESSAGES))),
             "stream": True,
             "top_p": self.config.top_p,
             "temperature": self.config.temperature,
@@ -125,38 +165,54 @@ class LLM(Component[[Channel[MessagesFrame], Channel[InterruptFrame]], LLMOutput
             "max_tokens": self.config.max_tokens,
         }
         
+        pending: list[str] = []
+        last_flush = time.monotonic()
+
+        def flush() -> None:
+            nonlocal last_flush
+            if pending:
+                self._output_text.send(TextFrame(display_name="llm_chunk", text="".join(pending)))
+                pending.clear()
+            last_flush = time.monotonic()
+
         try:
-            r = requests.post(self.config.url, headers=headers, json=payload, stream=True, timeout=60)
+            r = self._session.post(self.config.url, headers=headers, data=orjson.dumps(payload), stream=True, timeout=60)
             r.raise_for_status()
             
             for line in r.iter_lines():
                 with self._gen_lock:
                     if gen != self._generation:
+                        # Interrupted: drop the unsent text along with the rest of the turn.
+                        pending.clear()
                         self._output_text.send(TextFrame(display_name="llm_chunk", text=GENERATE_END_FLAG))
                         break
                 
-                if not line: continue
-                decoded = line.decode("utf-8")
-                if not decoded.startswith("data: "): continue
+                # Lines stay bytes; orjson parses UTF-8 directly.
+                if not line.startswith(b"data: "): continue
                 
-                data_str = decoded[6:].strip()
-                if data_str == "[DONE]": break
+                data = line[6:].strip()
+                if data == b"[DONE]": break
                 
-                try: chunk = json.loads(data_str)
-                except json.JSONDecodeError: continue
+                try: chunk = orjson.loads(data)
+                except orjson.JSONDecodeError: continue
                 
                 choices = chunk.get("choices") or []
                 if not choices: continue
                 
                 choice = choices[0]
                 if choice.get("finish_reason"):
+                    flush()
                     self._output_text.send(TextFrame(display_name="llm_chunk", text=GENERATE_END_FLAG))
                     break
                 
                 delta = choice.get("delta") or {}
                 text = delta.get("content") or ""
                 if text:
-                    self._output_text.send(TextFrame(display_name="llm_chunk", text=text))
+                    pending.append(text)
+                    if text.endswith(_FLUSH_ENDINGS) or time.monotonic() - last_flush >= _FLUSH_INTERVAL:
+                        flush()
                     
         except Exception as e:
             print(f"[LLM] Generation error: {e}")
+        finally:
+            flush()
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import base64
-import json
 import os
 import threading
+import time
 from typing import Any, TypedDict
 
+import orjson
+import pybase64
 from websockets.sync.client import connect, Connection
 
 from src.core.component import Component
@@ -14,9 +15,18 @@ from src.core.config import BaseConfig
 from src.core.frames import AudioFrame, AudioDataFormat, InterruptFrame
 
 
+# Static uplink messages, serialized once. Base64 needs no JSON escaping, so appends are built
+# by concatenation. Kept as str: websockets sends bytes as binary frames.
+_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = '"}'
+_CLEAR_MESSAGE = orjson.dumps({"type": "input_audio_buffer.clear"}).decode()
+
+
 class STSConfig(BaseConfig):
     model: str = "gpt-4o-realtime-preview-2024-10-01"
     voice: str = "alloy"
+    # Uplink audio is batched into appends of at least this much audio.
+    uplink_chunk_ms: int = 40
 
 
 class STSOutputs(TypedDict):
@@ -50,7 +60,8 @@ class STS(Component[[Channel[AudioFrame], Channel[InterruptFrame]], STSOutputs])
 
         with connect(url, additional_headers=headers) as ws:
             self._ws = ws
-            ws.send(json.dumps({
+            # Encoded to str: websockets sends bytes as binary frames, and the API expects text.
+            ws.send(orjson.dumps({
                 "type": "session.update",
                 "session": {
                     "modalities": ["text", "audio"],
@@ -59,7 +70,7 @@ class STS(Component[[Channel[AudioFrame], Channel[InterruptFrame]], STSOutputs])
                     "output_audio_format": "pcm16",
                     "turn_detection": {"type": "server_vad"},
                 },
-            }))
+            }).decode())
 
             if audio:
                 threading.Thread(target=self._send_loop, args=(ws, audio), daemon=True).start()
@@ -71,7 +82,7 @@ class STS(Component[[Channel[AudioFrame], Channel[InterruptFrame]], STSOutputs])
                         # Use .get() instead of .reason
                         print(f"[STS] Interrupt received: {frame.get()}")
                         # Clear the audio buffer on the server
-                        ws.send(json.dumps({"type": "input_audio_buffer.clear"}))
+                        ws.send(_CLEAR_MESSAGE)
 
                 threading.Thread(target=listen_interrupts, daemon=True).start()
 
@@ -79,9 +90,9 @@ class STS(Component[[Channel[AudioFrame], Channel[InterruptFrame]], STSOutputs])
                 if self.stop_event.is_set():
                     break
                 
-                event = json.loads(msg)
+                event = orjson.loads(msg)
                 if event["type"] == "response.audio.delta":
-                    pcm = base64.b64decode(event["delta"])
+                    pcm = pybase64.b64decode(event["delta"], validate=False)
                     # Use AudioFrame with data getter logic
                     frame = AudioFrame(
                         display_name="sts_audio",
@@ -96,6 +107,12 @@ class STS(Component[[Channel[AudioFrame], Channel[InterruptFrame]], STSOutputs])
         if not audio:
             return
 
+        # 24 kHz mono PCM16 is 48 bytes per millisecond.
+        chunk_bytes = 48 * self.config.uplink_chunk_ms
+        max_latency = self.config.uplink_chunk_ms / 1000
+        buf = bytearray()
+        first_ns = 0
+
         for frame in audio.stream(self):
             if frame is None:
                 break
@@ -106,12 +123,25 @@ class STS(Component[[Channel[AudioFrame], Channel[InterruptFrame]], STSOutputs])
                 num_channels=1,
                 data_format=AudioDataFormat.PCM16,
             )
-            b64 = base64.b64encode(pcm_bytes).decode("utf-8")
+            if not buf:
+                first_ns = time.monotonic_ns()
+            buf += pcm_bytes
+            # Short frames still ship within one chunk's worth of wall time.
+            if len(buf) < chunk_bytes and (time.monotonic_ns() - first_ns) / 1e9 < max_latency:
+                continue
             
             try:
-                ws.send(json.dumps({
-                    "type": "input_audio_buffer.append",
-                    "audio": b64,
-                }))
+                self._send_audio(ws, buf)
             except ConnectionClosed:
-                break
+                return
+            buf.clear()
+
+        if buf:
+            try:
+                self._send_audio(ws, buf)
+            except ConnectionClosed:
+                pass
+
+    @staticmethod
+    def _send_audio(ws: Connection, pcm: bytearray) -> None:
+        ws.send(_APPEND_PREFIX + pybase64.b64encode_as_string(pcm) + _APPEND_SUFFIX)
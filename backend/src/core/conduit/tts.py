@@ -1,23 +1,32 @@
 from __future__ import annotations
 
-import base64
-import json
+import itertools
 import os
 import re
 import threading
 from dataclasses import dataclass, field
+from enum import Enum
 from queue import Empty, Queue
-from typing import TypedDict, Callable
+from typing import Any, TypedDict, Callable
 
+import orjson
+import pybase64
 import requests
 
-from src.core.component import Component
+from src.core.component import Component, Status
 from src.core.channel import Channel
 from src.core.frames import AudioFrame, InterruptFrame, TextFrame
 from src.core.config import BaseConfig
 
 GENERATE_END_FLAG = "[END_OF_GENERATE]"
 
+class _Stop(Enum):
+    """Queued by stop() to shut the worker thread down."""
+    STOP = "stop"
+
+
+_STOP = _Stop.STOP
+
 
 def cut_space(buf: str) -> int:
     return max(buf.rfind(" "), buf.rfind("\n"), buf.rfind("\t"))
@@ -26,6 +35,10 @@ def cut_space(buf: str) -> int:
 _SENT_END = re.compile(r"""[.!?…]+["'\)\]\}]*($|\s)""")
 
 
+# Markup tokens one at a time, and runs of plain text whole.
+_MARKUP = re.compile(r"\*\*|[*\[\]()<>]|[^*\[\]()<>]+")
+
+
 def cut_sentence(buf: str) -> int:
     last = -1
     for m in _SENT_END.finditer(buf):
@@ -36,9 +49,15 @@ def cut_sentence(buf: str) -> int:
     return last
 
 
+# Cut functions known to be local: a cut point never depends on text before the scanned span,
+# so StreamFilter can scan only newly fed text with them.
+_LOCAL_CUTS: frozenset[Callable[[str], int]] = frozenset({cut_sentence, cut_space})
+
+
 @dataclass
 class StreamFilter:
-    speak_buf: str = ""
+    # Pending speech as chunks, joined only when a cut is emitted.
+    speak_buf: list[str] = field(default_factory=list)
     in_square: int = 0
     in_paren: int = 0
     in_angle: int = 0
@@ -47,42 +66,53 @@ class StreamFilter:
     cut_fn: Callable[[str], int] = field(default=cut_sentence)
 
     def feed(self, token: str, force: bool = False) -> str:
-        self._consume(token)
+        new = self._consume(token)
         if force:
-            out, self.speak_buf = self.speak_buf, ""
+            out = "".join(self.speak_buf) + new
+            self.speak_buf = []
             return out
 
-        cut = self.cut_fn(self.speak_buf)
-        if cut < 0:
-            return ""
-        out = self.speak_buf[: cut + 1]
-        self.speak_buf = self.speak_buf[cut + 1 :]
+        if self.cut_fn in _LOCAL_CUTS:
+            # Nothing buffered contains a cut point (feed would have emitted it), so a local
+            # cut function only needs to scan the new text.
+            cut = self.cut_fn(new)
+            if cut < 0:
+                if new:
+                    self.speak_buf.append(new)
+                return ""
+            out = "".join(self.speak_buf) + new[: cut + 1]
+            rest = new[cut + 1 :]
+        else:
+            text = "".join(self.speak_buf) + new
+            cut = self.cut_fn(text)
+            if cut < 0:
+                self.speak_buf = [text] if text else []
+                return ""
+            out, rest = text[: cut + 1], text[cut + 1 :]
+        self.speak_buf = [rest] if rest else []
         return out
 
-    def _consume(self, token: str) -> None:
-        i = 0
-        while i < len(token):
-            ch = token[i]
-            if ch == "*" and i + 1 < len(token) and token[i + 1] == "*":
+    def _consume(self, token: str) -> str:
+        """Updates the markup state and returns the speakable text in token."""
+        parts: list[str] = []
+        for tok in _MARKUP.findall(token):
+            if tok == "**":
                 self.in_bold = not self.in_bold
-                i += 2
                 continue
-            if ch == "*":
+            if tok == "*":
                 self.in_italic = not self.in_italic
-                i += 1
                 continue
             if not (self.in_bold or self.in_italic):
-                if ch == "[": self.in_square += 1; i += 1; continue
-                if ch == "]" and self.in_square: self.in_square -= 1; i += 1; continue
-                if ch == "(": self.in_paren += 1; i += 1; continue
-                if ch == ")" and self.in_paren: self.in_paren -= 1; i += 1; continue
-                if ch == "<": self.in_angle += 1; i += 1; continue
-                if ch == ">" and self.in_angle: self.in_angle -= 1; i += 1; continue
+                if tok == "[": self.in_square += 1; continue
+                if tok == "]" and self.in_square: self.in_square -= 1; continue
+                if tok == "(": self.in_paren += 1; continue
+                if tok == ")" and self.in_paren: self.in_paren -= 1; continue
+                if tok == "<": self.in_angle += 1; continue
+                if tok == ">" and self.in_angle: self.in_angle -= 1; continue
             if (self.in_square or self.in_paren or self.in_angle or self.in_bold or self.in_italic):
-                i += 1
                 continue
-            self.speak_buf += ch
-            i += 1
+            parts.append(tok)
+        return "".join(parts)
 
 
 class TTSConfig(BaseConfig):
@@ -108,9 +138,14 @@ class TTS(Component[[Channel[TextFrame], Channel[InterruptFrame]], TTSOutputs]):
         self._output_interrupt = Channel[InterruptFrame](name="interrupt")
         
         self._stream_filter = StreamFilter()
+        # Advanced on each interrupt. next() on a count is atomic, so interrupt threads need no
+        # lock, and readers compare the plain int without one.
+        self._gen_counter = itertools.count(1)
         self._generation = 0
-        self._gen_lock = threading.Lock()
-        self._task_queue: Queue[tuple[int, str]] = Queue()
+        self._task_queue: Queue[tuple[int, str] | _Stop] = Queue()
+
+        # Keep-alive session so each utterance reuses the TLS connection.
+        self._session = requests.Session()
 
     def get_output_channels(self) -> TTSOutputs:
         return {
@@ -119,55 +154,75 @@ class TTS(Component[[Channel[TextFrame], Channel[InterruptFrame]], TTSOutputs]):
             "interrupt": self._output_interrupt
         }
 
-    def _worker(self) -> None:
+    def start(self, *args: Any, **kwargs: Any) -> None:
+        if self.status == Status.RUNNING:
+            return
+        # Fresh queue before the thread exists, so a stop() right after start() reaches this run.
+        self._task_queue = Queue()
+        super().start(*args, **kwargs)
+
+    def stop(self) -> None:
+        super().stop()
+        # Wake the worker blocked on the task queue.
+        self._task_queue.put(_STOP)
+
+    def _next_task(self, tasks: Queue[tuple[int, str] | _Stop]) -> tuple[int, str] | _Stop:
+        """Next task, or _STOP once stop is set even if no sentinel arrives."""
+        while True:
+            try:
+                return tasks.get(timeout=0.5)
+            except Empty:
+                if self.stop_event.is_set():
+                    return _STOP
+
+    def _worker(self, tasks: Queue[tuple[int, str] | _Stop]) -> None:
         print("[TTS] Worker thread started")
-        while not self.stop_event.is_set():
+        while (task := self._next_task(tasks)) is not _STOP:
+            if self.stop_event.is_set():
+                continue  # drain to the sentinel without speaking
+            gen, text = task
+            if gen != self._generation: continue
+            
+            cred = os.getenv("INWORLD_API_CRED")
+            if not cred:
+                print("[TTS] INWORLD_API_CRED not set")
+                continue
+            
+            headers = {"Authorization": f"Basic {cred}", "Content-Type": "application/json"}
+            payload = {
+                "text": text,
+                "voiceId": self.config.voice_id,
+                "modelId": self.config.model_id,
+                "audio_config": {"audio_encoding": "LINEAR16", "sample_rate_hertz": 48000},
+            }
+            
             try:
-                gen, text = self._task_queue.get(timeout=0.1)
-                with self._gen_lock:
-                    if gen != self._generation: continue
-                
-                cred = os.getenv("INWORLD_API_CRED")
-                if not cred:
-                    print("[TTS] INWORLD_API_CRED not set")
-                    continue
-                
-                headers = {"Authorization": f"Basic {cred}", "Content-Type": "application/json"}
-                payload = {
-                    "text": text,
-                    "voiceId": self.config.voice_id,
-                    "modelId": self.config.model_id,
-                    "audio_config": {"audio_encoding": "LINEAR16", "sample_rate_hertz": 48000},
-                }
+                r = self._session.post(self.config.url, data=orjson.dumps(payload), headers=headers, stream=True, timeout=10)
+                r.raise_for_status()
+                for line in r.iter_lines():
+                    if gen != self._generation: break
+                    if not line: continue
+                    msg = orjson.loads(line)
+                    raw = pybase64.b64decode(msg["result"]["audioContent"], validate=False)
+                    if len(raw) > 44:
+                        # Use AudioFrame with data getter logic
+                        self._output_audio.send(AudioFrame(
+                            display_name="tts_audio",
+                            data=raw[44:],
+                            sample_rate=48000,
+                            channels=1
+                        ))
                 
-                try:
-                    r = requests.post(self.config.url, json=payload, headers=headers, stream=True, timeout=10)
-                    r.raise_for_status()
-                    for line in r.iter_lines():
-                        with self._gen_lock:
-                            if gen != self._generation: break
-                        if not line: continue
-                        msg = json.loads(line)
-                        raw = base64.b64decode(msg["result"]["audioContent"])
-                        if len(raw) > 44:
-                            # Use AudioFrame with data getter logic
-                            self._output_audio.send(AudioFrame(
-                                display_name="tts_audio",
-                                data=raw[44:],
-                                sample_rate=48000,
-                                channels=1
-                            ))
-                    
-                    with self._gen_lock:
-                        if gen == self._generation:
-                            self._output_text.send(TextFrame(display_name="tts_text", text=text))
-                except Exception as e:
-                    print(f"[TTS] Generation error: {e}")
-            except Empty: continue
+                if gen == self._generation:
+                    self._output_text.send(TextFrame(display_name="tts_text", text=text))
+            except Exception as e:
+                print(f"[TTS] Generation error: {e}")
 
     def run(self, text_input: Channel[TextFrame] | None = None, interrupt: Channel[InterruptFrame] | None = None) -> None:
         print("[TTS] Starting TTS")
-        worker_thread = threading.Thread(target=self._worker, daemon=True)
+        # This run's queue, held as a local so a later start() can't swap it underneath it.
+        tasks = self._task_queue
+        worker_thread = threading.Thread(target=self._worker, args=(tasks,), daemon=True)
         worker_thread.start()
 
         def handle_interrupts():
@@ -177,16 +232,18 @@ class TTS(Component[[Channel[TextFrame], Channel[InterruptFrame]], TTSOutputs]):
                 
                 print(f"[TTS] Interrupt received: {frame.get()}")
                 
-                with self._gen_lock:
-                    self._generation += 1
+                self._generation = next(self._gen_counter)
                 
                 # Forward the interrupt
                 self._output_interrupt.send(frame)
                 
                 self._stream_filter = StreamFilter()
-                while not self._task_queue.empty():
-                    try: self._task_queue.get_nowait()
+                while not tasks.empty():
+                    try: task = tasks.get_nowait()
                     except Empty: break
+                    if task is _STOP:
+                        tasks.put(_STOP)
+                        break
 
         threading.Thread(target=handle_interrupts, daemon=True).start()
 
@@ -197,8 +254,8 @@ class TTS(Component[[Channel[TextFrame], Channel[InterruptFrame]], TTSOutputs]):
                 t = frame.get()
                 out = self._stream_filter.feed("", force=True) if t == GENERATE_END_FLAG else self._stream_filter.feed(t)
                 if out and out.strip():
-                    with self._gen_lock: gen = self._generation
-                    self._task_queue.put((gen, out))
+                    gen = self._generation
+                    tasks.put((gen, out))
         
         worker_thread.join(timeout=1)
         print("[TTS] TTS stopped")
@@ -10,6 +10,7 @@ from src.api.graph.controller import router as graph_router
 from src.api.metrics.controller import router as metrics_router
 from src.api.component.controller import router as component_router
 from src.api.graph.domain.graph import Graph
+from src.core.component import Component
 
 
 from src.api.graph import service
@@ -17,8 +18,15 @@ from src.api.graph import service
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Import every component module up front so the async list handlers never do it on the loop.
+    # A failing import must not keep the server from starting; the registry then stays lazy.
+    try:
+        Component.registry_snapshot()
+    except Exception as e:
+        print(f"[backend] Component registry warm-up failed: {e!r}")
     app.state.graph = service.load_graph()
     yield
+    service.flush_auto_save()
 
 
 app = FastAPI(lifespan=lifespan)